@@ -0,0 +1,11 @@
+import subprocess
+import sys
+
+# -----------------------------
+# Gunicorn settings (used by start.sh)
+# -----------------------------
+def on_starting(server):
+    # Build the model cache once in a separate process before any worker is
+    # forked: workers then only memory-map the prepared arrays instead of each
+    # downloading and unpickling the model, and the master stays small.
+    subprocess.run([sys.executable, "-c", "import main; main.build_model_cache()"], check=True)
@@ -2,56 +2,484 @@ from fastapi import FastAPI, HTTPException
 from fastapi.responses import RedirectResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
-from typing import List, Optional
-from sklearn.metrics.pairwise import cosine_similarity
+from typing import List, Optional, Tuple
+from collections import OrderedDict
+from contextlib import asynccontextmanager, suppress
+from concurrent.futures import ThreadPoolExecutor
+from scipy.sparse import csr_matrix
+import numpy as np
 import pandas as pd
+import asyncio
 import pickle
+import io
+import tempfile
+import re
+import math
+import httpx
+import hashlib
+import stat
 import os
 
 # -----------------------------
 # Configuration
 # -----------------------------
-MODEL_PATH = "recommender_model.pkl"
+MODEL_URL = "https://drive.google.com/uc?export=download&id=1jR5h4E5CZfZWpGCwNqdq-i_19M62L75c"  # Direct download link
+MODEL_PATH = "recommender_model.pkl"  # Local model file, used instead of the download when present
+MAX_BATCH = 16      # Max requests scored together
+MAX_WAIT = 0.004    # Max seconds to wait for a batch to fill
+CACHE_SIZE = 4096   # Max cached (user text, limit) results
+SCORING_WORKERS = int(  # Threads scoring batches in parallel, split across gunicorn workers
+    os.environ.get("SCORING_WORKERS")
+    or max(1, (os.cpu_count() or 1) // int(os.environ.get("WEB_CONCURRENCY") or 1))
+)
+MODEL_CACHE_DIR = os.environ.get(  # Per-user cache directory, never a shared temp directory
+    "MODEL_CACHE_DIR",
+    os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "book_rec")
+)
+MODEL_SHA256 = (os.environ.get("MODEL_SHA256") or "").strip().lower() or None  # Optional expected SHA256 of the model file
+
+# -----------------------------
+# Load model from local file
+# -----------------------------
+def load_model_from_file(path: str):
+    print(f"Loading model from {path}...")
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+# -----------------------------
+# Load model from Google Drive
+# -----------------------------
+def ensure_cache_dir() -> str:
+    # Cached files are unpickled, so the directory must be private to this user:
+    # anyone who can write to it could plant a pickle and run code in the service.
+    global MODEL_CACHE_DIR
+    try:
+        os.makedirs(MODEL_CACHE_DIR, mode=0o700, exist_ok=True)
+    except OSError as e:
+        if "MODEL_CACHE_DIR" in os.environ:
+            raise
+        # The default location can't be created (read-only or HOME-less hosts),
+        # so fall back to a fresh temp directory that only this user can access
+        MODEL_CACHE_DIR = tempfile.mkdtemp(prefix="book_rec-")
+        print(f"Cannot create the model cache directory ({e}), using {MODEL_CACHE_DIR}")
+    info = os.lstat(MODEL_CACHE_DIR)
+    if not stat.S_ISDIR(info.st_mode):
+        raise Exception(f"Model cache path is not a directory: {MODEL_CACHE_DIR}")
+    if hasattr(os, "getuid"):
+        if info.st_uid != os.getuid():
+            raise Exception(f"Model cache directory is owned by another user: {MODEL_CACHE_DIR}")
+        if info.st_mode & 0o077:
+            os.chmod(MODEL_CACHE_DIR, 0o700)
+    return MODEL_CACHE_DIR
+
+def model_cache_path(url: str) -> str:
+    return os.path.join(MODEL_CACHE_DIR, f"{hashlib.sha1(url.encode()).hexdigest()}.pkl")
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+async def stream_model(url: str, f):
+    print("Downloading model from Google Drive...")
+    async with httpx.AsyncClient(follow_redirects=True, timeout=None) as client:
+        async with client.stream("GET", url) as response:
+            if response.status_code != 200:
+                raise Exception(f"Failed to download model. Status code: {response.status_code}")
+            async for chunk in response.aiter_bytes(1 << 20):
+                f.write(chunk)
+
+async def download_model(url: str, path: str):
+    # Stream the pickle straight to disk instead of holding the full response body
+    partial_path = f"{path}.{os.getpid()}.part"
+    try:
+        with open(partial_path, "wb") as f:
+            await stream_model(url, f)
+        os.replace(partial_path, path)
+    finally:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+
+async def load_model_from_drive(url: str, cached: bool = True):
+    if not cached:
+        # No usable cache directory: keep the download in memory
+        buffer = io.BytesIO()
+        await stream_model(url, buffer)
+        if MODEL_SHA256 and hashlib.sha256(buffer.getbuffer()).hexdigest() != MODEL_SHA256:
+            raise Exception("Downloaded model failed integrity check (SHA256 mismatch).")
+        buffer.seek(0)
+        return pickle.load(buffer)
+
+    # Reuse a previously downloaded copy, unless it fails the optional integrity check
+    path = model_cache_path(url)
+    if os.path.exists(path) and (not MODEL_SHA256 or file_sha256(path) == MODEL_SHA256):
+        print(f"Using cached model at {path}")
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            # Without MODEL_SHA256 a bad response (e.g. an HTML page) may have been cached
+            print(f"Cached model is unreadable ({e}), downloading it again...")
+            os.remove(path)
+
+    await download_model(url, path)
+    if MODEL_SHA256 and file_sha256(path) != MODEL_SHA256:
+        os.remove(path)
+        raise Exception("Downloaded model failed integrity check (SHA256 mismatch).")
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        os.remove(path)
+        raise
+
+# -----------------------------
+# Prepare model for serving
+# -----------------------------
+def plain_token_pattern(tfidf) -> Optional[str]:
+    # Plain lowercase word-unigram vectorizers tokenize with nothing but their
+    # token pattern; any other configuration needs sklearn's own analyzer.
+    plain = (
+        tfidf.analyzer == "word" and tfidf.lowercase and tfidf.ngram_range == (1, 1)
+        and tfidf.tokenizer is None and tfidf.preprocessor is None
+        and tfidf.strip_accents is None and tfidf.stop_words is None
+    )
+    return tfidf.token_pattern if plain else None
+
+# Token patterns that never match whitespace (sklearn's default), so the tokens
+# of space-joined words don't depend on the order the words are joined in
+ORDER_FREE_TOKEN_PATTERNS = {r"(?u)\b\w\w+\b"}
+
+def regex_analyzer(token_pattern: str):
+    find_tokens = re.compile(token_pattern).findall
+    return lambda text: find_tokens(text.lower())
+
+def prepare_model(tfidf, tfidf_matrix_books, df_books_meta) -> dict:
+    # Rows are L2-normalized once at load time, then stored term-major (one
+    # posting list of book weights per term) so scoring a query only reads the
+    # columns of the terms it contains.
+    book_matrix = csr_matrix(tfidf_matrix_books, dtype=np.float32)
+    book_matrix.sum_duplicates()
+    row_norms = np.sqrt(np.asarray(book_matrix.multiply(book_matrix).sum(axis=1)).ravel())
+    row_norms[row_norms == 0] = 1.0
+    book_matrix.data /= np.repeat(row_norms, np.diff(book_matrix.indptr)).astype(np.float32)
+    term_matrix = book_matrix.T.tocsr()
+
+    # Plain arrays indexed by book position, so building a response avoids a
+    # per-row DataFrame.iloc lookup. Missing values become NaN (floats) or None.
+    def metadata_column(name: str, default=None) -> pd.Series:
+        return df_books_meta.get(name, pd.Series(default, index=df_books_meta.index, dtype=object))
+
+    token_pattern = plain_token_pattern(tfidf)
+    return {
+        # Vectorizer internals used by vectorize_query instead of tfidf.transform
+        "token_pattern": token_pattern,
+        "analyzer": regex_analyzer(token_pattern) if token_pattern else tfidf.build_analyzer(),
+        "vocabulary": tfidf.vocabulary_,
+        "idf": tfidf.idf_.astype(np.float32) if tfidf.use_idf else np.ones(len(tfidf.vocabulary_), dtype=np.float32),
+        "binary": tfidf.binary,
+        "sublinear_tf": tfidf.sublinear_tf,
+        "term_matrix": term_matrix,
+        "titles": metadata_column("book_title", "N/A").astype(str).to_numpy(dtype=object),
+        "prices": metadata_column("book_price").to_numpy(dtype=np.float64),
+        "review_scores": metadata_column("review_score").to_numpy(dtype=np.float64),
+        "review_summaries": np.array(
+            [str(s) if pd.notna(s) else None for s in metadata_column("review_summary")], dtype=object
+        ),
+    }
+
+# -----------------------------
+# Slim model cache
+# -----------------------------
+# The prepared model is saved as plain NumPy arrays, so later starts neither
+# unpickle the sklearn vectorizer nor import scikit-learn at all. The book
+# matrix arrays are memory-mapped on load, so every worker process serves from
+# the same page-cache pages instead of holding its own copy.
+SLIM_FORMAT_VERSION = 2  # Bump whenever the cached layout or prepare_model output changes
+TERM_MATRIX_ARRAYS = ("data", "indices", "indptr")
+
+def slim_model_path(source: str) -> str:
+    key = f"{SLIM_FORMAT_VERSION}:{source}"
+    return os.path.join(MODEL_CACHE_DIR, f"{hashlib.sha1(key.encode()).hexdigest()}.slim")
+
+def save_slim_model(model: dict, path: str):
+    ensure_cache_dir()
+    terms = [""] * len(model["vocabulary"])
+    for term, j in model["vocabulary"].items():
+        terms[j] = term
+
+    # The arrays file is written last, so its presence marks a complete cache
+    term_matrix = model["term_matrix"]
+    files = [(f".{name}.npy", lambda f, name=name: np.save(f, getattr(term_matrix, name)))
+             for name in TERM_MATRIX_ARRAYS]
+    files.append(
+        (".npz", lambda f: np.savez(
+            f,
+            term_shape=np.array(term_matrix.shape),
+            terms=np.array(terms, dtype=str),
+            idf=model["idf"],
+            token_pattern=np.array(model["token_pattern"]),
+            binary=np.array(model["binary"]),
+            sublinear_tf=np.array(model["sublinear_tf"]),
+            titles=model["titles"],
+            prices=model["prices"],
+            review_scores=model["review_scores"],
+            review_summaries=model["review_summaries"],
+        ))
+    )
+    for suffix, save in files:
+        partial_path = f"{path}{suffix}.{os.getpid()}.part"
+        try:
+            with open(partial_path, "wb") as f:
+                save(f)
+            os.replace(partial_path, f"{path}{suffix}")
+        finally:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+
+def load_slim_model(path: str) -> dict:
+    print(f"Loading prepared model from {path}...")
+    with np.load(f"{path}.npz", allow_pickle=True) as arrays:
+        token_pattern = str(arrays["token_pattern"])
+        return {
+            "token_pattern": token_pattern,
+            "analyzer": regex_analyzer(token_pattern),
+            "vocabulary": {term: j for j, term in enumerate(arrays["terms"].tolist())},
+            "idf": arrays["idf"],
+            "binary": bool(arrays["binary"]),
+            "sublinear_tf": bool(arrays["sublinear_tf"]),
+            "term_matrix": csr_matrix(
+                tuple(np.load(f"{path}.{name}.npy", mmap_mode="r") for name in TERM_MATRIX_ARRAYS),
+                shape=tuple(arrays["term_shape"]), copy=False
+            ),
+            "titles": arrays["titles"],
+            "prices": arrays["prices"],
+            "review_scores": arrays["review_scores"],
+            "review_summaries": arrays["review_summaries"],
+        }
+
+# -----------------------------
+# Query vectorization
+# -----------------------------
+def vectorize_query(model: dict, text: str) -> Tuple[np.ndarray, np.ndarray]:
+    # Count the query's known terms directly, skipping TfidfVectorizer.transform's
+    # sparse matrix construction for what is typically a handful of words
+    vocabulary = model["vocabulary"]
+    counts = {}
+    for token in model["analyzer"](text):
+        j = vocabulary.get(token)
+        if j is not None:
+            counts[j] = counts.get(j, 0) + 1
+
+    indices = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+    values = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+    if model["binary"]:
+        values[:] = 1.0
+    elif model["sublinear_tf"]:
+        values = 1.0 + np.log(values)
+
+    # TF-IDF weights, L2-normalized (queries with no known terms stay zero)
+    values *= model["idf"][indices]
+    norm = np.sqrt(values @ values)
+    if norm > 0:
+        values /= norm
+    return indices, values
+
+# -----------------------------
+# Ranking
+# -----------------------------
+def rank_batch(model: dict, texts: List[str], limits: List[int]) -> List[Tuple[Tuple[int, float], ...]]:
+    term_matrix = model["term_matrix"]
+
+    # Vectorize the queries into a sparse (batch x terms) matrix
+    vectors = [vectorize_query(model, text) for text in texts]
+    indptr = np.zeros(len(vectors) + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum([len(indices) for indices, _ in vectors])
+    queries = csr_matrix(
+        (np.concatenate([values for _, values in vectors]), np.concatenate([indices for indices, _ in vectors]), indptr),
+        shape=(len(vectors), term_matrix.shape[0])
+    )
+
+    # Cosine similarity for the whole batch, reading only the posting lists of the query terms
+    similarity_scores = (queries @ term_matrix).toarray()
+
+    # Top-N per query (partial selection, then sort only the selected scores)
+    k = min(max(limits), similarity_scores.shape[1])
+    part = np.argpartition(similarity_scores, -k, axis=1)[:, -k:]
+
+    results = []
+    for row, limit in enumerate(limits):
+        scores, candidates = similarity_scores[row], part[row]
+        top_indices = candidates[np.argsort(-scores[candidates])][:limit]
+        # Round the selected scores in one vectorized pass
+        top_scores = np.round(scores[top_indices].astype(np.float64), 4)
+        results.append(tuple(zip(top_indices.tolist(), top_scores.tolist())))
+    return results
+
+# -----------------------------
+# Request batching
+# -----------------------------
+class RankingBatcher:
+    """Coalesces concurrent ranking requests into a single batched product.
+
+    Batches are scored on a thread pool and several can be in flight at once;
+    the sparse product and top-N selection run in SciPy/NumPy code that releases
+    the GIL, so scoring scales across cores.
+    """
+
+    def __init__(self):
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.cache: OrderedDict = OrderedDict()
+        self.executor = ThreadPoolExecutor(max_workers=SCORING_WORKERS, thread_name_prefix="ranking")
+        self.pending: set = set()
+        self.worker: Optional[asyncio.Task] = None
+
+    def start(self):
+        self.worker = asyncio.create_task(self.run())
+
+    async def stop(self):
+        self.worker.cancel()
+        with suppress(asyncio.CancelledError):
+            await self.worker
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def rank(self, user_text: str, limit: int, cache_key: str) -> Tuple[Tuple[int, float], ...]:
+        # Equivalent requests (same cache key) are answered from an LRU cache
+        key = (cache_key, limit)
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((user_text, limit, future))
+        ranked = await future
+
+        self.cache[key] = ranked
+        if len(self.cache) > CACHE_SIZE:
+            self.cache.popitem(last=False)
+        return ranked
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            # Wait for a first request, then collect more for up to MAX_WAIT seconds
+            batch = [await self.queue.get()]
+            deadline = loop.time() + MAX_WAIT
+            while len(batch) < MAX_BATCH:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Score in the background so the next batch can be collected meanwhile
+            task = asyncio.create_task(self.score(batch))
+            self.pending.add(task)
+            task.add_done_callback(self.pending.discard)
+
+    async def score(self, batch: list):
+        texts, limits, futures = zip(*batch)
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                self.executor, rank_batch, app.state.model, list(texts), list(limits)
+            )
+        except Exception as e:
+            results = [e] * len(futures)
+
+        for future, result in zip(futures, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+# -----------------------------
+# Model loading
+# -----------------------------
+async def load_model() -> Tuple[dict, str]:
+    if os.path.exists(MODEL_PATH):
+        model_stat = os.stat(MODEL_PATH)
+        source = f"{os.path.abspath(MODEL_PATH)}:{model_stat.st_mtime_ns}:{model_stat.st_size}"
+        model_source = "local_file"
+    else:
+        source = f"{MODEL_URL}:{MODEL_SHA256 or ''}"
+        model_source = "google_drive"
+
+    # Prefer the slim prepared model; the sklearn pickle is only read to build it.
+    # The cache is best-effort: without a usable directory the model is served
+    # from memory (e.g. on read-only serverless hosts).
+    try:
+        ensure_cache_dir()
+        slim_path = slim_model_path(source)
+    except OSError as e:
+        print(f"Model cache directory is unusable ({e}), serving the model from memory...")
+        slim_path = None
+    if slim_path and os.path.exists(f"{slim_path}.npz"):
+        try:
+            return load_slim_model(slim_path), model_source
+        except Exception as e:
+            print(f"Prepared model cache is unreadable ({e}), rebuilding it...")
+
+    if model_source == "local_file":
+        tfidf, tfidf_matrix_books, df_books_meta = load_model_from_file(MODEL_PATH)
+    else:
+        tfidf, tfidf_matrix_books, df_books_meta = await load_model_from_drive(MODEL_URL, cached=bool(slim_path))
+    model = prepare_model(tfidf, tfidf_matrix_books, df_books_meta)
+    if slim_path and model["token_pattern"]:
+        try:
+            save_slim_model(model, slim_path)
+        except OSError as e:
+            print(f"Could not cache the prepared model ({e}), serving it from memory...")
+        else:
+            # Reload from the cache so this process also serves from the shared mapping
+            model = load_slim_model(slim_path)
+    return model, model_source
+
+def build_model_cache():
+    # Download and prepare the model once, before gunicorn forks its workers
+    # (see gunicorn.conf.py), so workers only memory-map the prepared cache.
+    asyncio.run(load_model())
+    print("Model cache ready.")
+
+# -----------------------------
+# Application lifespan
+# -----------------------------
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load the model on startup rather than at import time
+    app.state.model, app.state.model_source = await load_model()
+    print("Model loaded successfully.")
+
+    app.state.batcher = RankingBatcher()
+    app.state.batcher.start()
+    yield
+    await app.state.batcher.stop()
 
 # -----------------------------
 # FastAPI instance
 # -----------------------------
 app = FastAPI(
-    title="Book Recommendation API (Local)",
-    description="Professional API for recommending books using TF-IDF & cosine similarity (Local Model).",
+    title="Book Recommendation API",
+    description="Professional API for recommending books using TF-IDF & cosine similarity.",
     version="1.0.0",
-    docs_url="/",
-    redoc_url="/redoc"
+    docs_url="/",        # Swagger UI at root
+    redoc_url="/redoc",  # ReDoc at /redoc
+    lifespan=lifespan
 )
 
-# Enable CORS
+# Enable CORS (optional, needed if frontend calls API)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=["*"],  # Allow all origins
     allow_methods=["*"],
     allow_headers=["*"]
 )
 
-# -----------------------------
-# Load model from local file
-# -----------------------------
-def load_model_from_file(path: str):
-    if not os.path.exists(path):
-        raise Exception(f"Model file not found at: {path}")
-    
-    print(f"Loading model from {path}...")
-    with open(path, "rb") as f:
-        model_data = pickle.load(f)
-    print("✓ Model loaded successfully.")
-    return model_data
-
-try:
-    tfidf, tfidf_matrix_books, df_books_meta = load_model_from_file(MODEL_PATH)
-    print("✓ Model initialized successfully.")
-except Exception as e:
-    print(f"✗ Error: Failed to load model: {e}")
-    raise
-
 # -----------------------------
 # Pydantic schemas
 # -----------------------------
@@ -80,9 +508,9 @@ class RecommendationResponse(BaseModel):
 def health_check():
     return {
         "status": "healthy",
-        "service": "Book Recommendation API (Local)",
+        "service": "Book Recommendation API",
         "version": "1.0.0",
-        "model_source": "local_file"
+        "model_source": app.state.model_source
     }
 
 # -----------------------------
@@ -91,47 +519,52 @@ def health_check():
 @app.post("/api/v1/recommendations", response_model=RecommendationResponse,
           summary="Get book recommendations",
           description="Returns a ranked list of recommended books based on domain and studied modules.")
-def recommend_books(payload: RecommendationRequest):
+async def recommend_books(payload: RecommendationRequest):
 
     if not payload.modules:
         raise HTTPException(status_code=400, detail="Modules list cannot be empty.")
 
-    # Create user text
+    # Create user text. The cache key ignores what the vectorizer ignores: case
+    # for plain lowercase vectorizers, and module order when their token pattern
+    # cannot match across the spaces joining the modules.
     user_text = " ".join([payload.domain] + payload.modules)
+    token_pattern = app.state.model["token_pattern"]
+    if token_pattern in ORDER_FREE_TOKEN_PATTERNS:
+        cache_key = " ".join([payload.domain.lower()] + sorted(m.lower() for m in payload.modules))
+    elif token_pattern:
+        cache_key = user_text.lower()
+    else:
+        cache_key = user_text
 
-    # Vectorize
-    user_vector = tfidf.transform([user_text])
-
-    # Cosine similarity
-    similarity_scores = cosine_similarity(user_vector, tfidf_matrix_books).flatten()
-
-    # Top-N
-    top_indices = similarity_scores.argsort()[-payload.limit:][::-1]
+    # Rank books (cached per cache key and limit, batched with concurrent requests)
+    ranked = await app.state.batcher.rank(user_text, payload.limit, cache_key)
 
     # Build response with book details
-    recommendations = []
-    for i, idx in enumerate(top_indices):
-        book = df_books_meta.iloc[idx]
-        recommendations.append(
-            Recommendation(
-                rank=i + 1,
-                title=str(book.get("book_title", "N/A")),
-                price=float(book["book_price"]) if pd.notna(book.get("book_price")) else None,
-                review_score=float(book["review_score"]) if pd.notna(book.get("review_score")) else None,
-                review_summary=str(book.get("review_summary", "")) if pd.notna(book.get("review_summary")) else None,
-                score=round(float(similarity_scores[idx]), 4)
-            )
+    model = app.state.model
+    titles, prices = model["titles"], model["prices"]
+    review_scores, review_summaries = model["review_scores"], model["review_summaries"]
+    # Inputs are already typed, so skip Pydantic validation when constructing
+    recommendations = [
+        Recommendation.model_construct(
+            rank=i + 1,
+            title=titles[idx],
+            price=None if math.isnan(prices[idx]) else float(prices[idx]),
+            review_score=None if math.isnan(review_scores[idx]) else float(review_scores[idx]),
+            review_summary=review_summaries[idx],
+            score=score
         )
+        for i, (idx, score) in enumerate(ranked)
+    ]
 
-    return RecommendationResponse(
+    return RecommendationResponse.model_construct(
         status="success",
         count=len(recommendations),
         recommendations=recommendations
     )
 
 # -----------------------------
-# Root endpoint
+# Optional root redirect to Swagger
 # -----------------------------
 @app.get("/", include_in_schema=False)
 def redirect_to_docs():
-    return RedirectResponse(url="/docs")
\ No newline at end of file
+    return RedirectResponse(url="/")
@@ -0,0 +1,11 @@
+#!/bin/sh
+# Run several uvicorn workers under gunicorn. gunicorn.conf.py builds the
+# prepared model cache once before forking; each worker then memory-maps the
+# book matrix from it, so they all share one physical copy.
+# Exported so main.py splits SCORING_WORKERS across the actual worker count.
+export WEB_CONCURRENCY="${WEB_CONCURRENCY:-4}"
+exec gunicorn main:app \
+    --config gunicorn.conf.py \
+    --worker-class uvicorn_worker.UvicornWorker \
+    --workers "$WEB_CONCURRENCY" \
+    --bind "0.0.0.0:${PORT:-8000}"